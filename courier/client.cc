@@ -115,11 +115,13 @@ void Client::cq_polling() {
 }
 
 Client::Client(absl::string_view server_address,
-               std::optional<absl::string_view> load_balancing_policy)
+               std::optional<absl::string_view> load_balancing_policy,
+               bool local_subchannel_pool)
     :
       cq_thread_(&Client::cq_polling, this),
       server_address_(server_address),
-      load_balancing_policy_(load_balancing_policy) {
+      load_balancing_policy_(load_balancing_policy),
+      local_subchannel_pool_(local_subchannel_pool) {
   ClientCreation();
 }
 
@@ -214,6 +216,10 @@ absl::Status Client::TryInit(CallContext* context) {
   if (load_balancing_policy_.has_value()) {
     channel_args.SetLoadBalancingPolicyName(*load_balancing_policy_);
   }
+  // By default gRPC shares connections between channels with equal arguments.
+  if (local_subchannel_pool_) {
+    channel_args.SetInt(GRPC_ARG_USE_LOCAL_SUBCHANNEL_POOL, 1);
+  }
   // Enable health checks. Especially useful for round_robin lb policy.
   channel_args.SetServiceConfigJSON(
       "{\"healthCheckConfig\": {\"serviceName\": \"\"}}");
@@ -48,10 +48,13 @@ namespace courier {
 //
 class Client {
  public:
-  // Creates a new Client that will connect to a Server.
+  // Creates a new Client that will connect to a Server. If
+  // `local_subchannel_pool` is true then the client does not share connections
+  // with other clients connecting to the same server.
   explicit Client(
       absl::string_view server_address,
-      std::optional<absl::string_view> load_balancing_policy = std::nullopt);
+      std::optional<absl::string_view> load_balancing_policy = std::nullopt,
+      bool local_subchannel_pool = false);
 
 
   ~Client();
@@ -121,6 +124,7 @@ class Client {
   // Stored for logging.
   const std::string server_address_;
   const std::optional<std::string> load_balancing_policy_;
+  const bool local_subchannel_pool_;
 
   // The RPC client channel and stub.
   std::shared_ptr<grpc::ChannelInterface> channel_;
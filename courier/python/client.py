@@ -23,11 +23,16 @@ client = courier.Client('my_server')
 result = client.my_function(4, 7)  # 11, evaluated on the server.
 """
 
+import asyncio
 from concurrent import futures
+import dataclasses
 import datetime
-from typing import List, Optional, Union
-import zoneinfo
+import functools
+import itertools
+import os
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
 
+from absl import logging
 from courier.python import py_client
 # Numpy import needed for proper operation of ../serialization/py_serialize.cc
 import numpy  
@@ -36,6 +41,67 @@ import numpy
 from pybind11_abseil.status import StatusNotOk as StatusThrown  # pytype: disable=import-error
 from pybind11_abseil.status import StatusNotOk  # pytype: disable=import-error
 
+# Executor running the done callbacks that users add to pending futures, so that
+# they do not block the thread which completes the calls.
+_CALLBACK_POOL = futures.ThreadPoolExecutor(
+    max_workers=min(32, (os.cpu_count() or 1) * 4),
+    thread_name_prefix='courier-cb')
+
+# Method name, positional arguments and keyword arguments of a call.
+CallSpec = Tuple[str, Tuple[Any, ...], Dict[str, Any]]
+
+# Arguments serialized by `Client` at construction if `warmup` is set.
+_WARMUP_ARGS = (numpy.zeros(1, numpy.float32),)
+
+# Supported values of `quantize_fp32_to` and their numpy types.
+_QUANTIZED_DTYPES = {'fp16': numpy.float16}
+
+# Timeout of oneway calls issued by a client without a call timeout. Oneway
+# calls cannot be cancelled, so they must not stay in flight forever.
+_ONEWAY_TIMEOUT_SEC = 60.0
+
+
+@dataclasses.dataclass(frozen=True)
+class _CallConfig:
+  """Configuration shared by all calls issued through a client."""
+
+  __slots__ = ('clients', 'wait_for_ready', 'timeout_sec', 'compress',
+               'chunk_tensors', 'quantize_dtype')
+
+  # One binding per channel. Calls are spread across them round robin.
+  clients: Tuple[py_client.PyClient, ...]
+  wait_for_ready: bool
+  # Zero means that no timeout is applied.
+  timeout_sec: float
+  compress: bool
+  chunk_tensors: bool
+  # Numpy type float32 array arguments are downcast to, if any.
+  quantize_dtype: Any
+
+  @property
+  def client(self) -> py_client.PyClient:
+    return self.clients[0]
+
+
+def _timeout_sec(
+    timeout: Optional[Union[int, float, datetime.timedelta]]) -> float:
+  """Converts `timeout` to seconds. Zero means that no timeout is applied."""
+  if isinstance(timeout, datetime.timedelta):
+    return timeout.total_seconds()
+  return float(timeout or 0)
+
+
+def _round_robin(fns: Sequence[Callable[..., Any]]) -> Callable[..., Any]:
+  """Returns a function forwarding each call to the next of `fns` in turn."""
+  if len(fns) == 1:
+    return fns[0]
+  next_fn = itertools.cycle(fns).__next__
+
+  def call(*args, **kwargs):
+    return next_fn()(*args, **kwargs)
+
+  return call
+
 
 def translate_status(s):
   """Translate Pybind11 status to Exception."""
@@ -47,6 +113,11 @@ def translate_status(s):
 
 
 def exception_handler(func):
+  """Re-raises StatusNotOk errors raised by `func` with a translated status.
+
+  Calls through the bindings raise StatusNotOk directly, so the client itself
+  no longer uses this decorator.
+  """
 
   def inner_function(*args, **kwargs):
     try:
@@ -57,26 +128,157 @@ def exception_handler(func):
   return inner_function
 
 
-def _calculate_deadline(
-    timeout: Optional[datetime.timedelta], propagate_deadline: bool
-) -> datetime.datetime:
-  """Calculate the out-bound deadline from timeout and existing deadline.
+def _quantize(value: Any, dtype: Any) -> Any:
+  if isinstance(value, numpy.ndarray) and value.dtype == numpy.float32:
+    return value.astype(dtype)
+  return value
 
-  Args:
-    timeout: Timeout to apply to all calls. If set to None or a zero-length
-      timedelta then no timeout is applied.
-    propagate_deadline: Unsupported feature.
 
-  Returns:
-    Returns the sooner of (now + timeout) and the existing deadline.
+def _quantize_args(
+    args: Tuple[Any, ...], kwargs: Dict[str, Any], dtype: Any
+) -> Tuple[Tuple[Any, ...], Dict[str, Any]]:
+  """Downcasts the float32 arrays among the top-level arguments to `dtype`."""
+  return (tuple(_quantize(a, dtype) for a in args),
+          {k: _quantize(v, dtype) for k, v in kwargs.items()})
+
+
+def _quantized_handler(handler: Callable[..., Any],
+                       dtype: Any) -> Callable[..., Any]:
+  """Wraps `handler` to downcast its float32 array arguments to `dtype`."""
+
+  def quantized(*args, **kwargs):
+    args, kwargs = _quantize_args(args, kwargs, dtype)
+    return handler(*args, **kwargs)
+
+  return quantized
+
+
+# State of a cancelled future whose waiters have not been notified yet.
+_CANCELLED = futures._base.CANCELLED  # pylint: disable=protected-access
+
+
+def _run_done_callback(fn: Callable[[futures.Future], Any],
+                       f: futures.Future):
+  try:
+    fn(f)
+  except Exception:  # pylint: disable=broad-except
+    logging.exception('Exception calling callback for %r', f)
+
+
+def _submit_done_callback(executor: futures.Executor,
+                          fn: Callable[[futures.Future], Any],
+                          f: futures.Future):
+  executor.submit(_run_done_callback, fn, f)
+
+
+class FastFuture(futures.Future):
+  """Future holding the result of an asynchronous call.
+
+  A `concurrent.futures.Future` whose done callbacks can be run on an executor
+  rather than in the thread completing the call.
   """
-  deadline = datetime.datetime.max.replace(tzinfo=zoneinfo.ZoneInfo('UTC'))
-  if timeout:
-    deadline_timeout = (
-        datetime.datetime.now(tz=zoneinfo.ZoneInfo('UTC')) + timeout
-    )
-    deadline = min(deadline, deadline_timeout)
-  return deadline
+
+  def __init__(self, executor: Optional[futures.Executor] = None):
+    """Creates a pending future.
+
+    Args:
+      executor: If set, done callbacks added while the future is pending are
+        run on this executor rather than in the thread completing the future.
+    """
+    super().__init__()
+    self._executor = executor
+
+  def cancel(self) -> bool:
+    """Cancels the future unless it has already finished.
+
+    Returns:
+      True if the future is cancelled, False if it has already finished.
+    """
+    if not super().cancel():
+      return False
+    # `futures.wait` and `futures.as_completed` only see a cancelled future as
+    # done once it is notified, which is otherwise left to executors.
+    with self._condition:
+      if self._state == _CANCELLED:
+        self.set_running_or_notify_cancel()
+    return True
+
+  def add_done_callback(self, fn: Callable[[futures.Future], Any]):
+    """Calls `fn` with the future once it is done (immediately if it is).
+
+    If the future is pending and has an executor, `fn` is run on the executor.
+
+    Args:
+      fn: Callable taking the future as its only argument.
+    """
+    executor = self._executor
+    if executor is not None and not self.done():
+      fn = functools.partial(_submit_done_callback, executor, fn)
+    super().add_done_callback(fn)
+
+
+def _set_future_result(f: futures.Future, r: Any):
+  try:
+    f.set_result(r)
+  except futures.InvalidStateError:
+    # The call could have been already canceled by the user.
+    pass
+
+
+def _set_future_exception(f: futures.Future, e: BaseException):
+  try:
+    f.set_exception(e)
+  except futures.InvalidStateError:
+    pass
+
+
+def _cancel_call(canceller: py_client.PyClientCallCanceller,
+                 f: Union[futures.Future, asyncio.Future]):
+  """Done callback cancelling the call behind `f` if `f` was cancelled.
+
+  The callback holds the canceller only: holding the object referencing the
+  future instead would create a cycle keeping the result alive after the
+  future is released.
+  """
+  if f.cancelled():
+    canceller.Cancel()
+
+
+class _AsyncCall:
+  """Callbacks connecting an in-flight asynchronous call to its future."""
+
+  __slots__ = ('future',)
+
+  def __init__(self, future: FastFuture):
+    self.future = future
+
+  def set_result(self, r):
+    try:
+      self.future.set_result(r)
+    except futures.InvalidStateError:
+      # The call could have been already canceled by the user.
+      pass
+
+  def set_exception(self, s):
+    try:
+      self.future.set_exception(translate_status(s))
+    except futures.InvalidStateError:
+      pass
+
+
+class _AsyncMultiCall:
+  """Callbacks shared by the calls of a batch issued by `multi_call`."""
+
+  __slots__ = ('futures',)
+
+  def __init__(self, futures_list: List[FastFuture]):
+    self.futures = futures_list
+
+  def set_result(self, i: int, r):
+    _set_future_result(self.futures[i], r)
+
+  def set_exception(self, i: int, s):
+    _set_future_exception(self.futures[i], translate_status(s))
 
 
 class _AsyncClient:
@@ -84,65 +286,52 @@ class _AsyncClient:
 
   def __init__(
       self,
-      client: 'Client',
-      wait_for_ready: bool,
-      call_timeout: Optional[datetime.timedelta],
-      compress: bool,
-      chunk_tensors: bool,
-      propagate_deadline: bool = False,
+      config: _CallConfig,
+      callback_executor: Optional[futures.Executor] = None,
   ):
-    self._client = client
-    self._wait_for_ready = wait_for_ready
-    self._call_timeout = call_timeout
-    self._compress = compress
-    self._chunk_tensors = chunk_tensors
-    self._propagate_deadline = propagate_deadline
+    self._config = config
+    self._callback_executor = callback_executor or _CALLBACK_POOL
+    # Maps method names to their handlers. Racing inserts are benign as every
+    # handler built for a given method is equivalent.
+    self._handlers: Dict[str, Callable[..., FastFuture]] = {}
 
   def _build_handler(self, method: str):
     """Build a future handler for a given method."""
-    def call(*args, **kwargs):  
-      f = futures.Future()
-
-      def set_exception(s):
-        try:
-          f.set_exception(translate_status(s))
-        except futures.InvalidStateError:  # pytype: disable=module-attr
-          # Call could have been already canceled by the user.
-          pass
-
-      def set_result(r):
-        try:
-          f.set_result(r)
-        except futures.InvalidStateError:
-          # Call could have been already canceled by the user.
-          pass
-
-      deadline = _calculate_deadline(
-          self._call_timeout, self._propagate_deadline
-      )
-
-      canceller = self._client.AsyncPyCall(
+    # The configuration is fixed for the lifetime of the client, so it is bound
+    # to locals of the closure rather than looked up for every call.
+    config = self._config
+    async_py_call = _round_robin([c.AsyncPyCall for c in config.clients])
+    callback_executor = self._callback_executor
+    wait_for_ready = config.wait_for_ready
+    timeout_sec = config.timeout_sec
+    compress = config.compress
+    chunk_tensors = config.chunk_tensors
+
+    def call(*args, **kwargs):
+      f = FastFuture(callback_executor)
+      async_call = _AsyncCall(f)
+      canceller = async_py_call(
           method,
-          list(args),
+          args,
           kwargs,
-          set_result,
-          set_exception,
-          self._wait_for_ready,
-          deadline,
-          self._compress,
-          self._chunk_tensors,
+          async_call.set_result,
+          async_call.set_exception,
+          wait_for_ready,
+          timeout_sec,
+          compress,
+          chunk_tensors,
       )
-
-      def done_callback(f):
-        if f.cancelled():
-          canceller.Cancel()
-
-      f.add_done_callback(done_callback)
+      # Cancellation is cheap and must not wait behind user callbacks, so it
+      # bypasses the executor.
+      futures.Future.add_done_callback(
+          f, functools.partial(_cancel_call, canceller))
       return f
 
+    if config.quantize_dtype is not None:
+      return _quantized_handler(call, config.quantize_dtype)
     return call
 
-  def __getattr__(self, method):
+  def bind(self, method: str) -> Callable[..., FastFuture]:
     """Gets a callable function for the method that returns a future.
 
     Args:
@@ -151,10 +340,144 @@ class _AsyncClient:
     Returns:
       Callable function for the method that returns a future.
     """
-    return self._build_handler(method)
+    handler = self._handlers.get(method)
+    if handler is None:
+      handler = self._handlers[method] = self._build_handler(method)
+    return handler
+
+  __getattr__ = bind
+  __getitem__ = bind
+
+  def __call__(self, *args, **kwargs):
+    return self.bind('__call__')(*args, **kwargs)
+
+  def multi_call(self, calls: Sequence[CallSpec]) -> List[FastFuture]:
+    """Issues a batch of calls with a single round trip to the bindings.
+
+    Args:
+      calls: (method, args, kwargs) tuples, where `args` is a tuple and
+        `kwargs` a dict.
+
+    Returns:
+      One future per call, in order.
+    """
+    config = self._config
+    if config.quantize_dtype is not None:
+      calls = [(method, *_quantize_args(args, kwargs, config.quantize_dtype))
+               for method, args, kwargs in calls]
+    fs = [FastFuture(self._callback_executor) for _ in calls]
+    multi_call = _AsyncMultiCall(fs)
+    cancellers = config.client.AsyncMultiPyCall(
+        calls,
+        multi_call.set_result,
+        multi_call.set_exception,
+        config.wait_for_ready,
+        config.timeout_sec,
+        config.compress,
+        config.chunk_tensors,
+    )
+    for f, canceller in zip(fs, cancellers):
+      futures.Future.add_done_callback(
+          f, functools.partial(_cancel_call, canceller))
+    return fs
+
+
+class _AioCall:
+  """Callbacks resolving an asyncio future from the completion thread."""
+
+  __slots__ = ('loop', 'future')
+
+  def __init__(self, loop: asyncio.AbstractEventLoop, future: asyncio.Future):
+    self.loop = loop
+    self.future = future
+
+  def _resolve(self, fn: Callable[..., Any], value: Any):
+    try:
+      self.loop.call_soon_threadsafe(fn, self.future, value)
+    except RuntimeError:
+      # The event loop was closed while the call was in flight.
+      pass
+
+  def set_result(self, r):
+    self._resolve(_set_aio_result, r)
+
+  def set_exception(self, s):
+    self._resolve(_set_aio_exception, translate_status(s))
+
+
+def _set_aio_result(f: asyncio.Future, r: Any):
+  # The call could have been already canceled by the user.
+  if not f.done():
+    f.set_result(r)
+
+
+def _set_aio_exception(f: asyncio.Future, e: BaseException):
+  if not f.done():
+    f.set_exception(e)
+
+
+class _AioClient:
+  """Asynchronous client returning asyncio futures.
+
+  Calls must be issued from a coroutine running in an event loop. The futures
+  are resolved on that loop directly from the completion callbacks.
+  """
+
+  def __init__(self, config: _CallConfig):
+    self._config = config
+    # Maps method names to their handlers.
+    self._handlers: Dict[str, Callable[..., asyncio.Future]] = {}
+
+  def _build_handler(self, method: str):
+    """Build an asyncio future handler for a given method."""
+    config = self._config
+    async_py_call = _round_robin([c.AsyncPyCall for c in config.clients])
+    wait_for_ready = config.wait_for_ready
+    timeout_sec = config.timeout_sec
+    compress = config.compress
+    chunk_tensors = config.chunk_tensors
+
+    def call(*args, **kwargs):
+      loop = asyncio.get_running_loop()
+      f = loop.create_future()
+      aio_call = _AioCall(loop, f)
+      canceller = async_py_call(
+          method,
+          args,
+          kwargs,
+          aio_call.set_result,
+          aio_call.set_exception,
+          wait_for_ready,
+          timeout_sec,
+          compress,
+          chunk_tensors,
+      )
+      f.add_done_callback(functools.partial(_cancel_call, canceller))
+      return f
+
+    if config.quantize_dtype is not None:
+      return _quantized_handler(call, config.quantize_dtype)
+    return call
+
+  def bind(self, method: str) -> Callable[..., asyncio.Future]:
+    """Gets a callable function for the method that returns an asyncio future.
+
+    Args:
+      method: Name of the method.
+
+    Returns:
+      Callable function for the method that returns an asyncio future.
+    """
+    handler = self._handlers.get(method)
+    if handler is None:
+      handler = self._handlers[method] = self._build_handler(method)
+    return handler
+
+  __getattr__ = bind
+  __getitem__ = bind
 
   def __call__(self, *args, **kwargs):
-    return self._build_handler('__call__')(*args, **kwargs)
+    return self.bind('__call__')(*args, **kwargs)
 
 
 class Client:
@@ -162,6 +485,11 @@ class Client:
 
   This provides a convenience wrapper around the CLIF bindings which allows
   calling server methods as if they were class methods.
+
+  The GIL is released while a call is in flight, so synchronous calls made
+  from multiple threads run concurrently. Synchronous calls do not allocate a
+  future; use `futures` or `aio` for asynchronous calls and `oneway` for calls
+  whose result is not needed.
   """
 
   def __init__(
@@ -174,6 +502,10 @@ class Client:
       *,
       load_balancing_policy: Optional[str] = None,
       propagate_deadline: bool = True,
+      callback_executor: Optional[futures.Executor] = None,
+      quantize_fp32_to: Optional[str] = None,
+      channels: int = 1,
+      warmup: bool = False,
   ):
     """Initiates a new client that will connect to a server.
 
@@ -191,30 +523,73 @@ class Client:
         spread the load across all backends. More details at:
         https://github.com/grpc/grpc/blob/master/doc/load-balancing.md
       propagate_deadline: Unsupported feature.
+      callback_executor: Executor running the done callbacks added to the
+        futures returned by `futures`. Defaults to a bounded thread pool shared
+        by all clients. Callbacks never run on the thread completing the RPCs.
+      quantize_fp32_to: If set to 'fp16', float32 numpy arrays passed as
+        top-level call arguments are converted to float16 before being sent,
+        which halves their size on the wire. The conversion is lossy and the
+        server receives float16 arrays. Nested arrays are sent unchanged.
+      channels: Number of gRPC channels, each with its own connections, to
+        spread calls across round robin. More than one channel can increase
+        the throughput of clients issuing many concurrent calls. Batches issued
+        with `multi_call` are sent over a single channel.
+      warmup: Whether to serialize a throwaway float32 array at construction.
+        This only runs the argument serialization code once: it has no lazily
+        built state, so no measured first-call cost is removed. The server is
+        not contacted.
+
+    Raises:
+      ValueError: If `quantize_fp32_to` or `channels` is not supported.
     """
+    if channels < 1:
+      raise ValueError(f'channels must be at least 1, got {channels}.')
+    if (quantize_fp32_to is not None and
+        quantize_fp32_to not in _QUANTIZED_DTYPES):
+      raise ValueError(
+          f'Unsupported quantize_fp32_to: {quantize_fp32_to!r}. Supported '
+          f'values are {sorted(_QUANTIZED_DTYPES)} and None.')
     self._init_args = (server_address, compress, call_timeout, wait_for_ready)
+    self._init_kwargs = dict(quantize_fp32_to=quantize_fp32_to,
+                             channels=channels, warmup=warmup)
+    # Maps method names to their handlers.
+    self._handlers: Dict[str, Callable[..., Any]] = {}
+    self._oneway_handlers: Dict[Tuple[str, bool, Any], Callable[..., None]] = {}
     self._address = str(server_address)
-    self._compress = compress
-    self._client = py_client.PyClient(self._address, load_balancing_policy)
-    if call_timeout:
-      if isinstance(call_timeout, datetime.timedelta):
-        self._call_timeout = call_timeout
-      else:
-        self._call_timeout = datetime.timedelta(seconds=call_timeout)
+    if channels == 1:
+      clients = (py_client.PyClient(self._address, load_balancing_policy),)
     else:
-      self._call_timeout = None
-    self._wait_for_ready = wait_for_ready
-    self._chunk_tensors = chunk_tensors
-    self._async_client = _AsyncClient(self._client, self._wait_for_ready,
-                                      self._call_timeout, self._compress,
-                                      self._chunk_tensors, propagate_deadline)
+      clients = tuple(
+          py_client.PyClient(self._address, load_balancing_policy, True)
+          for _ in range(channels))
+    self._client = clients[0]
+    if warmup:
+      try:
+        self._client.WarmUp(_WARMUP_ARGS)
+      except StatusNotOk as e:
+        logging.warning('Failed to warm up client for %s: %s', self._address, e)
+    self._config = _CallConfig(
+        clients=clients,
+        wait_for_ready=wait_for_ready,
+        # Passed to the bindings, which compute the deadline.
+        timeout_sec=_timeout_sec(call_timeout),
+        compress=compress,
+        chunk_tensors=chunk_tensors,
+        quantize_dtype=_QUANTIZED_DTYPES.get(quantize_fp32_to),
+    )
+    self._async_client = _AsyncClient(self._config, callback_executor)
     self._propagate_deadline = propagate_deadline
 
   def __del__(self):
-    self._client.Shutdown()
+    # `__init__` may have raised before the client was created.
+    config = self.__dict__.get('_config')
+    if config is not None:
+      for client in config.clients:
+        client.Shutdown()
 
   def __reduce__(self):
-    return self.__class__, self._init_args
+    return functools.partial(
+        self.__class__, *self._init_args, **self._init_kwargs), ()
 
   @property
   def address(self) -> str:
@@ -225,6 +600,15 @@ class Client:
     """Gets an asynchronous client on which a method call returns a future."""
     return self._async_client
 
+  @functools.cached_property
+  def aio(self) -> _AioClient:
+    """Gets an asyncio client on which a method call returns an awaitable.
+
+    Example:
+      result = await client.aio.my_function(4, 7)
+    """
+    return _AioClient(self._config)
+
   def _build_handler(self, method: str):
     """Build a callable handler for a given method.
 
@@ -234,23 +618,113 @@ class Client:
     Returns:
       Handler for the method.
     """
-    @exception_handler
-    def func(*args, **kwargs):
-      deadline = _calculate_deadline(
-          self._call_timeout, self._propagate_deadline
-      )
+    config = self._config
+    # The handler is implemented in C++ and bound to the call configuration,
+    # so calling it dispatches straight into the bindings. pybind11_abseil
+    # raises StatusNotOk for failed calls.
+    func = _round_robin([
+        c.BindMethod(
+            method,
+            config.wait_for_ready,
+            config.timeout_sec,
+            config.compress,
+            config.chunk_tensors,
+        ) for c in config.clients
+    ])
+
+    if config.quantize_dtype is not None:
+      return _quantized_handler(func, config.quantize_dtype)
+    return func
 
-      return self._client.PyCall(
-          method,
-          list(args),
-          kwargs,
-          self._wait_for_ready,
-          deadline,
-          self._compress,
-          self._chunk_tensors,
-      )
+  def bind(self, method: str) -> Callable[..., Any]:
+    """Gets the callable function for the method.
 
-    return func
+    Binding a method once and calling the returned function avoids the
+    attribute lookup of `client.method(...)` in hot loops:
+
+      step = client.bind('step')
+      for _ in range(n):
+        step(observation)
+
+    `client['step']` is equivalent. Unlike attribute access, this also works
+    for methods whose name collides with an attribute of the client.
+
+    Args:
+      method: Name of the method.
+
+    Returns:
+      Callable function for the method.
+    """
+    handler = self._handlers.get(method)
+    if handler is None:
+      handler = self._handlers[method] = self._build_handler(method)
+    return handler
+
+  __getitem__ = bind
+
+  def oneway(
+      self,
+      method: str,
+      *,
+      wait_for_ready: bool = False,
+      timeout: Optional[Union[int, float, datetime.timedelta]] = None,
+  ) -> Callable[..., None]:
+    """Gets a function issuing fire-and-forget calls of the method.
+
+    The returned function sends the call and returns None without waiting for
+    a response. The result of the call and any error are dropped, so this is
+    meant for e.g. telemetry updates which need no acknowledgement:
+
+      client.oneway('log_metrics')(step, metrics)
+
+    Oneway calls cannot be cancelled. So that they do not pile up while the
+    server is down or unresponsive, they do not wait for the server by default
+    and they always have a timeout.
+
+    Args:
+      method: Name of the method.
+      wait_for_ready: Whether calls wait for the server to come online rather
+        than being dropped when it is unavailable.
+      timeout: Timeout of the calls. Defaults to the call timeout of the client
+        or, if it has none, to 60 seconds. If 0 then no timeout is applied.
+
+    Returns:
+      Callable function for the method.
+    """
+    key = (method, wait_for_ready, timeout)
+    handler = self._oneway_handlers.get(key)
+    if handler is None:
+      handler = self._oneway_handlers[key] = self._build_oneway_handler(
+          method, wait_for_ready, timeout)
+    return handler
+
+  def _build_oneway_handler(
+      self,
+      method: str,
+      wait_for_ready: bool,
+      timeout: Optional[Union[int, float, datetime.timedelta]],
+  ) -> Callable[..., None]:
+    config = self._config
+    oneway_py_call = _round_robin([c.OnewayPyCall for c in config.clients])
+    if timeout is not None:
+      timeout_sec = _timeout_sec(timeout)
+    else:
+      timeout_sec = config.timeout_sec or _ONEWAY_TIMEOUT_SEC
+    compress = config.compress
+    chunk_tensors = config.chunk_tensors
+
+    def call(*args, **kwargs) -> None:
+      oneway_py_call(method, args, kwargs, wait_for_ready, timeout_sec,
+                     compress, chunk_tensors)
+
+    if config.quantize_dtype is not None:
+      return _quantized_handler(call, config.quantize_dtype)
+    return call
+
+  @property
+  def oneway_calls_in_flight(self) -> int:
+    """Number of oneway calls issued by the client which have not completed."""
+    return sum(c.OnewayCallsInFlight() for c in self._config.clients)
 
   def __getattr__(self, method: str):
     """Gets a callable function for the method and sets it as an attribute.
@@ -262,16 +736,42 @@ class Client:
       Callable function for the method.
     """
 
-    func = self._build_handler(method)
+    func = self.bind(method)
     setattr(self, method, func)
     return func
 
-  @exception_handler
   def __call__(self, *args, **kwargs):
-    return self._build_handler('__call__')(*args, **kwargs)
+    return self.bind('__call__')(*args, **kwargs)
+
+  def multi_call(self, calls: Sequence[CallSpec]) -> List[Any]:
+    """Issues a batch of calls concurrently and waits for all of them.
+
+    The batch is handed to the bindings at once, which release the GIL a
+    single time for all calls.
+
+    Args:
+      calls: (method, args, kwargs) tuples, where `args` is a tuple and
+        `kwargs` a dict.
+
+    Returns:
+      The results of the calls, in order.
+
+    Raises:
+      StatusNotOk: The error of the first failed call, if any.
+    """
+    config = self._config
+    if config.quantize_dtype is not None:
+      calls = [(method, *_quantize_args(args, kwargs, config.quantize_dtype))
+               for method, args, kwargs in calls]
+    return config.client.MultiPyCall(
+        calls,
+        config.wait_for_ready,
+        config.timeout_sec,
+        config.compress,
+        config.chunk_tensors,
+    )
 
 
-@exception_handler
 def list_methods(client: Client) -> List[str]:
   """Lists the methods which are available on the server.
 
@@ -14,13 +14,15 @@
 
 """Tests for courier.python.py_client."""
 
+import asyncio
 from concurrent import futures
 import datetime
+import gc
 import pickle
 import threading
 import time
 from typing import Optional, Union
-import zoneinfo
+import weakref
 
 from absl.testing import absltest
 from absl.testing import parameterized
@@ -120,6 +122,23 @@ class PyIntegrationTest(parameterized.TestCase):
     future = self._client.futures.add_default(23)
     self.assertEqual(future.result(), 123)
 
+  @parameterized.named_parameters(('call', False), ('multi_call', True))
+  def testAsyncResultIsFreedWithFuture(self, use_multi_call: bool):
+    gc.disable()
+    self.addCleanup(gc.enable)
+    if use_multi_call:
+      (f,) = self._client.futures.multi_call([('echo', (np.zeros(3),), {})])
+    else:
+      f = self._client.futures.echo(np.zeros(3))
+    result = weakref.ref(f.result())
+    del f
+    # The completion thread can still be releasing its callbacks.
+    for _ in range(100):
+      if result() is None:
+        break
+      time.sleep(0.01)
+    self.assertIsNone(result())
+
   def testAsyncFutureCancel(self):
     future = self._client.futures.sleep(2)
     self.assertTrue(future.cancel())
@@ -137,6 +156,220 @@ class PyIntegrationTest(parameterized.TestCase):
     with self.assertRaisesRegex(StatusNotOk, expected_msg):
       future.result()
 
+  def testAsyncFuturesWithStandardLibrary(self):
+    fs = [self._client.futures.lambda_add(i, 1) for i in range(3)]
+    done, not_done = futures.wait(fs, timeout=10)
+    self.assertLen(done, 3)
+    self.assertEmpty(not_done)
+    fs = [self._client.futures.lambda_add(i, 1) for i in range(3)]
+    self.assertCountEqual(
+        [f.result() for f in futures.as_completed(fs, timeout=10)], [1, 2, 3])
+
+    async def wrapped():
+      return await asyncio.wrap_future(self._client.futures.lambda_add(1, 2))
+
+    self.assertEqual(asyncio.run(wrapped()), 3)
+
+  @parameterized.named_parameters(
+      ('float32', np.arange(24, dtype=np.float32).reshape(2, 3, 4)),
+      ('uint8', np.arange(24, dtype=np.uint8).reshape(4, 6)),
+      ('bool', np.array([True, False, True])),
+      ('scalar', np.array(3, dtype=np.int64)),
+      ('empty', np.zeros((0, 3), dtype=np.float64)),
+      ('non_contiguous', np.arange(24, dtype=np.int32).reshape(4, 6)[:, ::2]),
+      ('fortran_order', np.asfortranarray(np.arange(6.).reshape(2, 3))),
+      ('big_endian', np.arange(6, dtype='>i4')),
+  )
+  def testNumpyArgumentRoundTrip(self, array):
+    result = self._client.echo(array)
+    self.assertEqual(result.shape, array.shape)
+    self.assertEqual(result.dtype.newbyteorder('='),
+                     array.dtype.newbyteorder('='))
+    np.testing.assert_array_equal(result, array)
+
+  @parameterized.named_parameters(('async', True), ('sync', False))
+  def testQuantizeFp32ToFp16(self, use_async: bool):
+    self._client = client.Client(
+        self._server.address, quantize_fp32_to='fp16')
+    array = np.arange(6, dtype=np.float32)
+    if use_async:
+      result = self._client.futures.echo(a=array).result()
+    else:
+      result = self._client.echo(array)
+    self.assertEqual(result.dtype, np.float16)
+    np.testing.assert_array_equal(result, array)
+    # Arrays of other types are sent unchanged.
+    self.assertEqual(self._client.echo(np.arange(3)).dtype, np.arange(3).dtype)
+
+  def testPickledClientKeepsQuantization(self):
+    self._client = pickle.loads(pickle.dumps(
+        client.Client(self._server.address, quantize_fp32_to='fp16')))
+    self.assertEqual(self._client.echo(np.zeros(3, np.float32)).dtype,
+                     np.float16)
+
+  def testQuantizeFp32ToUnsupported(self):
+    with self.assertRaisesRegex(ValueError, 'Unsupported quantize_fp32_to'):
+      client.Client(self._server.address, quantize_fp32_to='int4')
+
+  def testMultipleChannels(self):
+    self._client = client.Client(self._server.address, channels=3)
+    self.assertEqual([self._client.lambda_add(i, 1) for i in range(6)],
+                     [1, 2, 3, 4, 5, 6])
+    fs = [self._client.futures.lambda_add(i, 1) for i in range(6)]
+    self.assertEqual([f.result() for f in fs], [1, 2, 3, 4, 5, 6])
+    unpickled = pickle.loads(pickle.dumps(self._client))
+    self.assertLen(unpickled._config.clients, 3)
+
+  def testMultipleChannelsSpreadCallsAndCancellation(self):
+    make_py_client = client.py_client.PyClient
+    # Cancellers of the calls issued on each channel.
+    cancellers = []
+
+    def make_channel(*args):
+      py_client = make_py_client(*args)
+      channel_cancellers = []
+      cancellers.append(channel_cancellers)
+
+      def async_py_call(*call_args):
+        canceller = mock.Mock(wraps=py_client.AsyncPyCall(*call_args))
+        channel_cancellers.append(canceller)
+        return canceller
+
+      channel = mock.Mock(wraps=py_client)
+      channel.AsyncPyCall.side_effect = async_py_call
+      return channel
+
+    with mock.patch.object(
+        client.py_client, 'PyClient', side_effect=make_channel):
+      self._client = client.Client(self._server.address, channels=2)
+    fs = [self._client.futures.sleep(1) for _ in range(2)]
+    self.assertEqual([len(c) for c in cancellers], [1, 1])
+    self.assertTrue(fs[1].cancel())
+    cancellers[1][0].Cancel.assert_called_once()
+    cancellers[0][0].Cancel.assert_not_called()
+    self.assertIsNone(fs[0].result())
+
+  def testInvalidNumberOfChannels(self):
+    with self.assertRaisesRegex(ValueError, 'channels must be at least 1'):
+      client.Client(self._server.address, channels=0)
+
+  def testSyncCallsFromThreadsRunConcurrently(self):
+    threads = [
+        threading.Thread(target=self._client.sleep, args=(1,))
+        for _ in range(4)
+    ]
+    start = time.time()
+    for thread in threads:
+      thread.start()
+    for thread in threads:
+      thread.join()
+    self.assertLess(time.time() - start, 3)
+
+  def testBind(self):
+    add = self._client.bind('lambda_add')
+    self.assertIs(self._client.bind('lambda_add'), add)
+    self.assertIs(self._client['lambda_add'], add)
+    self.assertEqual(add(12, 5), 17)
+
+  def testBindCollidingWithClientAttribute(self):
+    self._server.Bind('address', lambda: 'from server')
+    self.assertEqual(self._client.bind('address')(), 'from server')
+    self.assertNotEqual(self._client.address, 'from server')
+
+  def testAsyncBind(self):
+    add = self._client.futures.bind('lambda_add')
+    self.assertIs(self._client.futures['lambda_add'], add)
+    self.assertEqual(add(12, 5).result(), 17)
+
+  def testOnewayCall(self):
+    received = threading.Event()
+    self._server.Bind('notify', received.set)
+    self.assertIsNone(self._client.oneway('notify')())
+    self.assertTrue(received.wait(timeout=10))
+
+  def testOnewayCallDropsErrors(self):
+    self.assertIsNone(self._client.oneway('exception_method')())
+
+  def _wait_for_oneway_calls(self, my_client, timeout):
+    deadline = time.time() + timeout
+    while my_client.oneway_calls_in_flight and time.time() < deadline:
+      time.sleep(0.01)
+    return my_client.oneway_calls_in_flight
+
+  def testOnewayCallToUnavailableServerIsDropped(self):
+    my_client = client.Client('[::]:12345')
+    my_client.oneway('blah')()
+    self.assertEqual(self._wait_for_oneway_calls(my_client, timeout=10), 0)
+
+  def testOnewayCallWaitingForServerTimesOut(self):
+    my_client = client.Client('[::]:12345')
+    my_client.oneway('blah', wait_for_ready=True, timeout=1)()
+    self.assertEqual(my_client.oneway_calls_in_flight, 1)
+    self.assertEqual(self._wait_for_oneway_calls(my_client, timeout=10), 0)
+
+  def testDeleteClientWithOnewayCallToUnavailableServer(self):
+    my_client = client.Client('[::]:12345')
+    my_client.oneway('blah', wait_for_ready=True, timeout=0)()
+
+    def delete():
+      nonlocal my_client
+      del my_client
+
+    thread = threading.Thread(target=delete, daemon=True)
+    thread.start()
+    thread.join(timeout=10)
+    self.assertFalse(thread.is_alive())
+
+  def testMultiCall(self):
+    results = self._client.multi_call([
+        ('lambda_add', (1, 2), {}),
+        ('add_default', (23,), {'b': 500}),
+        ('no_args', (), {}),
+    ])
+    self.assertEqual(results, [3, 523, 1000])
+
+  def testMultiCallException(self):
+    with self.assertRaisesRegex(StatusNotOk, 'Exception method called'):
+      self._client.multi_call([
+          ('no_args', (), {}),
+          ('exception_method', (), {}),
+      ])
+
+  def testAsyncMultiCall(self):
+    fs = self._client.futures.multi_call([
+        ('lambda_add', (1, 2), {}),
+        ('exception_method', (), {}),
+    ])
+    self.assertEqual(fs[0].result(), 3)
+    with self.assertRaisesRegex(StatusNotOk, 'Exception method called'):
+      fs[1].result()
+
+  def testAioCall(self):
+
+    async def call():
+      return await self._client.aio.add_default(23)
+
+    self.assertEqual(asyncio.run(call()), 123)
+    self.assertIs(self._client.aio, self._client.aio)
+
+  def testAioException(self):
+
+    async def call():
+      return await self._client.aio.exception_method()
+
+    with self.assertRaisesRegex(StatusNotOk, 'Exception method called'):
+      asyncio.run(call())
+
+  def testAioCancel(self):
+
+    async def call():
+      f = self._client.aio.sleep(2)
+      self.assertTrue(f.cancel())
+      with self.assertRaises(asyncio.CancelledError):
+        await f
+
+    asyncio.run(call())
+
   def testListMethods(self):
     self.assertCountEqual(
         client.list_methods(self._client),
@@ -214,6 +447,16 @@ class PyIntegrationTest(parameterized.TestCase):
     with self.assertRaisesRegex(StatusNotOk, 'Deadline Exceeded'):
       self._call_sleep(duration=2, use_async=use_async)
 
+  @parameterized.named_parameters(
+      ('async', True, -1), ('sync', False, -1),
+      ('timedelta', False, datetime.timedelta(seconds=-1)),
+  )
+  def testErrorDeadlineExceededWhenTimeoutIsNegative(self, use_async: bool,
+                                                     timeout):
+    self._client = client.Client(self._server.address, call_timeout=timeout)
+    with self.assertRaisesRegex(StatusNotOk, 'Deadline Exceeded'):
+      self._call_sleep(duration=0, use_async=use_async)
+
   @parameterized.named_parameters(('async', True), ('sync', False))
   def testErrorDeadlineExceededWhenUnknownServerAddress(self, use_async: bool):
     self._client = client.Client(
@@ -242,6 +485,101 @@ class PyIntegrationTest(parameterized.TestCase):
                                 'failed to connect to all addresses'):
       my_client_bad.blah()
 
+  @parameterized.named_parameters(
+      ('warmup', dict(warmup=True), ['WarmUp']),
+      ('no_warmup', dict(warmup=False), []),
+      ('default', {}, []),
+  )
+  def testWarmupOnlySerializes(self, kwargs, expected_calls):
+    make_py_client = client.py_client.PyClient
+    py_clients = []
+
+    def make_spy(*args):
+      py_clients.append(mock.Mock(wraps=make_py_client(*args)))
+      return py_clients[-1]
+
+    with mock.patch.object(client.py_client, 'PyClient', side_effect=make_spy):
+      my_client = client.Client(self._server.address, **kwargs)
+    (py_client,) = py_clients
+    # Warming up does not touch the channel, e.g. through `ListMethods`.
+    self.assertEqual([name for name, _, _ in py_client.mock_calls],
+                     expected_calls)
+    if expected_calls:
+      ((args,), _) = py_client.WarmUp.call_args
+      self.assertIsInstance(args[0], np.ndarray)
+    self.assertEqual(my_client.lambda_add(1, 2), 3)
+
+
+class FastFutureTest(absltest.TestCase):
+
+  def testSetResult(self):
+    f = client.FastFuture()
+    self.assertFalse(f.done())
+    f.set_result(1)
+    self.assertTrue(f.done())
+    self.assertEqual(f.result(), 1)
+    self.assertIsNone(f.exception())
+
+  def testSetException(self):
+    f = client.FastFuture()
+    f.set_exception(ValueError('error'))
+    with self.assertRaisesRegex(ValueError, 'error'):
+      f.result()
+    self.assertIsInstance(f.exception(), ValueError)
+
+  def testCompletingCancelledCallIsIgnored(self):
+    f = client.FastFuture()
+    call = client._AsyncCall(f)
+    self.assertTrue(f.cancel())
+    call.set_result(1)
+    self.assertTrue(f.cancelled())
+    with self.assertRaises(futures.CancelledError):
+      f.result()
+
+  def testWaitForCancelledFuture(self):
+    f = client.FastFuture()
+    threading.Timer(0.01, f.cancel).start()
+    done, _ = futures.wait([f], timeout=10)
+    self.assertEqual(done, {f})
+
+  def testCancelAfterResult(self):
+    f = client.FastFuture()
+    f.set_result(1)
+    self.assertFalse(f.cancel())
+    self.assertFalse(f.cancelled())
+
+  def testResultTimeout(self):
+    f = client.FastFuture()
+    with self.assertRaises(futures.TimeoutError):
+      f.result(timeout=0.01)
+
+  def testResultFromOtherThread(self):
+    f = client.FastFuture()
+    threading.Timer(0.01, f.set_result, args=(5,)).start()
+    self.assertEqual(f.result(timeout=10), 5)
+
+  def testDoneCallback(self):
+    f = client.FastFuture()
+    done = []
+    f.add_done_callback(done.append)
+    self.assertEmpty(done)
+    f.set_result(1)
+    self.assertEqual(done, [f])
+    f.add_done_callback(done.append)
+    self.assertEqual(done, [f, f])
+
+  def testDoneCallbackRunsOnExecutor(self):
+    executor = futures.ThreadPoolExecutor(
+        max_workers=1, thread_name_prefix='test-cb')
+    f = client.FastFuture(executor)
+    thread_names = []
+    f.add_done_callback(
+        lambda _: thread_names.append(threading.current_thread().name))
+    f.set_result(1)
+    executor.shutdown(wait=True)
+    self.assertLen(thread_names, 1)
+    self.assertStartsWith(thread_names[0], 'test-cb')
+
 
 if __name__ == '__main__':
   absltest.main()
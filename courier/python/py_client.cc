@@ -17,6 +17,7 @@
 #include <pybind11/functional.h>
 #include <pybind11/pybind11.h>
 #include <pybind11/pytypes.h>
+#include <pybind11/stl.h>
 
 #include <functional>
 #include <memory>
@@ -29,6 +30,9 @@
 #include "absl/status/status.h"
 #include "absl/status/statusor.h"
 #include "absl/strings/string_view.h"
+#include "absl/synchronization/blocking_counter.h"
+#include "absl/synchronization/mutex.h"
+#include "absl/time/clock.h"
 #include "absl/time/time.h"
 #include "courier/call_context.h"
 #include "courier/client.h"
@@ -44,8 +48,36 @@ namespace courier {
 
 namespace py = pybind11;
 
+namespace {
+
+absl::Time DeadlineFromTimeout(double timeout_sec) {
+  if (timeout_sec == 0) return absl::InfiniteFuture();
+  return absl::Now() + absl::Seconds(timeout_sec);
+}
+
+// Deserializes `result_or` and passes it to `result_cb`, or passes the error
+// status to `exception_cb`. Must be called with the GIL held.
+template <typename ResultCallback, typename ExceptionCallback>
+void DeliverPyResult(const absl::StatusOr<courier::CallResult>& result_or,
+                     const ResultCallback& result_cb,
+                     const ExceptionCallback& exception_cb) {
+  if (!result_or.ok()) {
+    exception_cb(py::cast(py::google::DoNotThrowStatus(result_or.status())));
+    return;
+  }
+  absl::StatusOr<courier::SafePyObjectPtr> py_result =
+      DeserializePyObject(result_or.value().result());
+  if (!py_result.ok()) {
+    exception_cb(py::cast(py::google::DoNotThrowStatus(py_result.status())));
+    return;
+  }
+  result_cb(py::reinterpret_steal<py::object>(py_result.value().release()));
+}
+
+}  // namespace
+
 absl::StatusOr<py::object> PyClient::PyCall(const std::string& method,
-                                            const py::list& args,
+                                            const py::tuple& args,
                                             const py::dict& kwargs,
                                             bool wait_for_ready,
                                             absl::Time deadline,
@@ -66,8 +98,18 @@ absl::StatusOr<py::object> PyClient::PyCall(const std::string& method,
   return py::reinterpret_steal<py::object>(py_object.release());
 }
 
+absl::StatusOr<py::object> PyClient::PyCall(const std::string& method,
+                                            const py::tuple& args,
+                                            const py::dict& kwargs,
+                                            bool wait_for_ready,
+                                            double timeout_sec,
+                                            bool compress, bool chunk_tensors) {
+  return PyCall(method, args, kwargs, wait_for_ready,
+                DeadlineFromTimeout(timeout_sec), compress, chunk_tensors);
+}
+
 absl::StatusOr<PyClientCallCanceller> PyClient::AsyncPyCall(
-    const std::string& method, const py::list& args, const py::dict& kwargs,
+    const std::string& method, const py::tuple& args, const py::dict& kwargs,
     PyObjectCallback result_cb, PyObjectCallback exception_cb,
     bool wait_for_ready, absl::Time deadline, bool compress,
     bool chunk_tensors) {
@@ -85,27 +127,165 @@ absl::StatusOr<PyClientCallCanceller> PyClient::AsyncPyCall(
       [exception_cb = std::move(exception_cb), result_cb = std::move(result_cb),
        context](const absl::StatusOr<courier::CallResult>& result_or) {
         py::gil_scoped_acquire gil;
-        if (!result_or.ok()) {
-          exception_cb(
-              py::cast(py::google::DoNotThrowStatus(result_or.status())));
-          return;
-        }
-        const courier::CallResult& result = result_or.value();
-        absl::StatusOr<courier::SafePyObjectPtr> py_result =
-            DeserializePyObject(result.result());
-        if (!py_result.ok()) {
-          exception_cb(
-              py::cast(py::google::DoNotThrowStatus(py_result.status())));
-          return;
-        }
-        result_cb(
-            py::reinterpret_steal<py::object>(py_result.value().release()));
+        DeliverPyResult(result_or, result_cb, exception_cb);
       });
 
   PyEval_RestoreThread(thread_state);
   return PyClientCallCanceller([context] { context->Cancel(); });
 }
 
+absl::StatusOr<PyClientCallCanceller> PyClient::AsyncPyCall(
+    const std::string& method, const py::tuple& args, const py::dict& kwargs,
+    PyObjectCallback result_cb, PyObjectCallback exception_cb,
+    bool wait_for_ready, double timeout_sec, bool compress,
+    bool chunk_tensors) {
+  return AsyncPyCall(method, args, kwargs, std::move(result_cb),
+                     std::move(exception_cb), wait_for_ready,
+                     DeadlineFromTimeout(timeout_sec), compress,
+                     chunk_tensors);
+}
+
+absl::Status PyClient::OnewayPyCall(const std::string& method,
+                                    const py::tuple& args,
+                                    const py::dict& kwargs,
+                                    bool wait_for_ready, double timeout_sec,
+                                    bool compress, bool chunk_tensors) {
+  auto arguments = absl::make_unique<courier::CallArguments>();
+  COURIER_RETURN_IF_ERROR(SerializePybindArgs(args, kwargs, arguments.get()));
+
+  auto context = std::make_shared<CallContext>(
+      /*deadline=*/DeadlineFromTimeout(timeout_sec),
+      /*wait_for_ready=*/wait_for_ready, /*compress=*/compress,
+      /*interruptible=*/true, /*chunk_tensors=*/chunk_tensors);
+  {
+    absl::MutexLock lock(&oneway_mu_);
+    oneway_calls_.insert(context.get());
+  }
+  // Release the GIL as `AsynCallF` might block on `Client::Init()`.
+  PyThreadState* thread_state = PyEval_SaveThread();
+  // The callback only keeps the context alive until the call has finished.
+  AsyncCallF(context.get(), method, std::move(arguments),
+             [this, context](const absl::StatusOr<courier::CallResult>&) {
+               absl::MutexLock lock(&oneway_mu_);
+               oneway_calls_.erase(context.get());
+             });
+  PyEval_RestoreThread(thread_state);
+  return absl::OkStatus();
+}
+
+absl::StatusOr<py::list> PyClient::MultiPyCall(
+    const std::vector<PyCallSpec>& calls, bool wait_for_ready,
+    double timeout_sec, bool compress, bool chunk_tensors) {
+  const size_t num_calls = calls.size();
+  std::vector<std::unique_ptr<courier::CallArguments>> arguments;
+  arguments.reserve(num_calls);
+  for (const PyCallSpec& call : calls) {
+    arguments.push_back(std::make_unique<courier::CallArguments>());
+    COURIER_RETURN_IF_ERROR(SerializePybindArgs(
+        std::get<1>(call), std::get<2>(call), arguments.back().get()));
+  }
+
+  const absl::Time deadline = DeadlineFromTimeout(timeout_sec);
+  std::vector<std::unique_ptr<CallContext>> contexts;
+  contexts.reserve(num_calls);
+  std::vector<absl::StatusOr<courier::CallResult>> results(num_calls);
+  absl::BlockingCounter pending(static_cast<int>(num_calls));
+
+  // The GIL is released once for the whole batch. All calls are in flight
+  // concurrently and the batch returns once the slowest has finished.
+  PyThreadState* thread_state = PyEval_SaveThread();
+  for (size_t i = 0; i < num_calls; ++i) {
+    contexts.push_back(std::make_unique<CallContext>(
+        /*deadline=*/deadline, /*wait_for_ready=*/wait_for_ready,
+        /*compress=*/compress, /*interruptible=*/true,
+        /*chunk_tensors=*/chunk_tensors));
+    AsyncCallF(contexts.back().get(), std::get<0>(calls[i]),
+               std::move(arguments[i]),
+               [&results, &pending,
+                i](absl::StatusOr<courier::CallResult> result_or) {
+                 results[i] = std::move(result_or);
+                 pending.DecrementCount();
+               });
+  }
+  pending.Wait();
+  PyEval_RestoreThread(thread_state);
+
+  py::list py_results(num_calls);
+  for (size_t i = 0; i < num_calls; ++i) {
+    COURIER_ASSIGN_OR_RETURN(courier::CallResult result,
+                             std::move(results[i]));
+    COURIER_ASSIGN_OR_RETURN(courier::SafePyObjectPtr py_object,
+                             DeserializePyObject(result.result()));
+    py_results[i] = py::reinterpret_steal<py::object>(py_object.release());
+  }
+  return py_results;
+}
+
+absl::StatusOr<std::vector<PyClientCallCanceller>> PyClient::AsyncMultiPyCall(
+    const std::vector<PyCallSpec>& calls, IndexedPyObjectCallback result_cb,
+    IndexedPyObjectCallback exception_cb, bool wait_for_ready,
+    double timeout_sec, bool compress, bool chunk_tensors) {
+  const size_t num_calls = calls.size();
+  std::vector<std::unique_ptr<courier::CallArguments>> arguments;
+  arguments.reserve(num_calls);
+  for (const PyCallSpec& call : calls) {
+    arguments.push_back(absl::make_unique<courier::CallArguments>());
+    COURIER_RETURN_IF_ERROR(SerializePybindArgs(
+        std::get<1>(call), std::get<2>(call), arguments.back().get()));
+  }
+
+  // All calls of the batch share the callbacks, which receive the index of
+  // the call they complete.
+  auto callbacks =
+      std::make_shared<std::pair<IndexedPyObjectCallback,
+                                 IndexedPyObjectCallback>>(
+          std::move(result_cb), std::move(exception_cb));
+  const absl::Time deadline = DeadlineFromTimeout(timeout_sec);
+  std::vector<PyClientCallCanceller> cancellers;
+  cancellers.reserve(num_calls);
+
+  // Release the GIL as `AsynCallF` might block on `Client::Init()`.
+  PyThreadState* thread_state = PyEval_SaveThread();
+  for (size_t i = 0; i < num_calls; ++i) {
+    auto context = std::make_shared<CallContext>(
+        /*deadline=*/deadline, /*wait_for_ready=*/wait_for_ready,
+        /*compress=*/compress,
+        /*interruptible=*/true, /*chunk_tensors=*/chunk_tensors);
+    AsyncCallF(
+        context.get(), std::get<0>(calls[i]), std::move(arguments[i]),
+        [callbacks, context,
+         i](const absl::StatusOr<courier::CallResult>& result_or) {
+          py::gil_scoped_acquire gil;
+          DeliverPyResult(
+              result_or,
+              [&](py::object result) { callbacks->first(i, result); },
+              [&](py::object status) { callbacks->second(i, status); });
+        });
+    cancellers.emplace_back([context] { context->Cancel(); });
+  }
+  PyEval_RestoreThread(thread_state);
+  return cancellers;
+}
+
+int64_t PyClient::OnewayCallsInFlight() {
+  absl::MutexLock lock(&oneway_mu_);
+  return oneway_calls_.size();
+}
+
+void PyClient::Shutdown() {
+  {
+    absl::MutexLock lock(&oneway_mu_);
+    for (CallContext* context : oneway_calls_) context->Cancel();
+  }
+  // Waits for the cancelled calls to complete.
+  Client::Shutdown();
+}
+
+absl::Status PyClient::WarmUp(const py::tuple& args) {
+  courier::CallArguments arguments;
+  return SerializePybindArgs(args, py::dict(), &arguments);
+}
+
 namespace {
 
 PYBIND11_MODULE(py_client, m) {
@@ -115,10 +295,49 @@ PYBIND11_MODULE(py_client, m) {
   py::class_<PyClientCallCanceller>(m, "PyClientCallCanceller")
       .def("Cancel", &PyClientCallCanceller::Cancel);
 
+  py::class_<PyClientMethod>(m, "PyClientMethod")
+      .def("__call__", &PyClientMethod::Call)
+      .def_property_readonly("method", &PyClientMethod::method);
+
   py::class_<PyClient, std::shared_ptr<PyClient>>(m, "PyClient")
       .def(py::init<const std::string&, const std::optional<std::string>&>())
-      .def("PyCall", &PyClient::PyCall)
-      .def("AsyncPyCall", &PyClient::AsyncPyCall)
+      .def(py::init<const std::string&, const std::optional<std::string>&,
+                    bool>())
+      // The timeout overloads are registered first so that a float timeout is
+      // never considered for conversion to an absl::Time deadline.
+      .def("PyCall",
+           py::overload_cast<const std::string&, const py::tuple&,
+                             const py::dict&, bool, double, bool, bool>(
+               &PyClient::PyCall))
+      .def("PyCall",
+           py::overload_cast<const std::string&, const py::tuple&,
+                             const py::dict&, bool, absl::Time, bool, bool>(
+               &PyClient::PyCall))
+      .def("AsyncPyCall",
+           py::overload_cast<const std::string&, const py::tuple&,
+                             const py::dict&, PyClient::PyObjectCallback,
+                             PyClient::PyObjectCallback, bool, double, bool,
+                             bool>(
+               &PyClient::AsyncPyCall))
+      .def("AsyncPyCall",
+           py::overload_cast<const std::string&, const py::tuple&,
+                             const py::dict&, PyClient::PyObjectCallback,
+                             PyClient::PyObjectCallback, bool, absl::Time, bool,
+                             bool>(
+               &PyClient::AsyncPyCall))
+      .def("BindMethod",
+           [](std::shared_ptr<PyClient> client, std::string method,
+              bool wait_for_ready, double timeout_sec, bool compress,
+              bool chunk_tensors) {
+             return PyClientMethod(std::move(client), std::move(method),
+                                   wait_for_ready, timeout_sec, compress,
+                                   chunk_tensors);
+           })
+      .def("OnewayPyCall", &PyClient::OnewayPyCall)
+      .def("OnewayCallsInFlight", &PyClient::OnewayCallsInFlight)
+      .def("MultiPyCall", &PyClient::MultiPyCall)
+      .def("AsyncMultiPyCall", &PyClient::AsyncMultiPyCall)
+      .def("WarmUp", &PyClient::WarmUp)
       .def("ListMethods", &PyClient::ListMethods,
            py::call_guard<py::gil_scoped_release>())
       .def("Shutdown", &PyClient::Shutdown,
@@ -17,13 +17,21 @@
 
 #include <pybind11/pybind11.h>
 
+#include <cstdint>
 #include <functional>
+#include <memory>
 #include <string>
+#include <tuple>
+#include <utility>
 #include <vector>
 
+#include "absl/base/thread_annotations.h"
+#include "absl/container/flat_hash_set.h"
 #include "absl/status/statusor.h"
 #include "absl/strings/string_view.h"
+#include "absl/synchronization/mutex.h"
 #include "absl/time/time.h"
+#include "courier/call_context.h"
 #include "courier/client.h"
 #include <pybind11/pybind11.h>
 
@@ -51,29 +59,140 @@ class PyClientCallCanceller {
 //
 //   client = courier.Client('example_server')
 //   print client.please_add(4, 7)  # 11, computed on the server.
+//
+// The call methods expect the GIL to be held. They serialize the arguments,
+// then release the GIL for as long as the call is in flight, including while
+// blocking on channel initialization, so other Python threads keep running.
+// The GIL is reacquired only to deserialize the result. The completion
+// callbacks of the asynchronous variants acquire the GIL to deserialize the
+// result and invoke the Python callback. A `py::call_guard` cannot be used
+// here since (de)serialization creates and inspects Python objects.
 class PyClient : public Client {
  public:
   using Client::Client;  // inherit all constructors from Client.
   using PyObjectCallback = std::function<void(pybind11::object)>;
+  using IndexedPyObjectCallback =
+      std::function<void(size_t, pybind11::object)>;
+  // Method name, positional arguments and keyword arguments of a call.
+  using PyCallSpec =
+      std::tuple<std::string, pybind11::tuple, pybind11::dict>;
+
+  // Cancels the outstanding oneway calls before the members they use are
+  // destroyed.
+  ~PyClient() { Shutdown(); }
 
-  // Calls a method on the server with a list of arguments.
+  // Cancels the outstanding oneway calls, which cannot be cancelled otherwise,
+  // then shuts down the client. Without this, a oneway call waiting for an
+  // unavailable server would block the shutdown forever.
+  void Shutdown() ABSL_LOCKS_EXCLUDED(oneway_mu_);
+
+  // Calls a method on the server with a tuple of arguments.
   // The result from calling the method will be returned as a Python object.
   absl::StatusOr<pybind11::object> PyCall(const std::string& method,
-                                          const pybind11::list& args,
+                                          const pybind11::tuple& args,
                                           const pybind11::dict& kwargs,
                                           bool wait_for_ready,
                                           absl::Time deadline,
                                           bool compress,
                                           bool chunk_tensors);
 
+  // Variant of PyCall which takes a timeout in seconds instead of a deadline.
+  // The deadline is computed as `absl::Now() + timeout_sec`. A zero timeout
+  // means no deadline is applied, a negative one that the deadline has passed.
+  absl::StatusOr<pybind11::object> PyCall(const std::string& method,
+                                          const pybind11::tuple& args,
+                                          const pybind11::dict& kwargs,
+                                          bool wait_for_ready,
+                                          double timeout_sec,
+                                          bool compress,
+                                          bool chunk_tensors);
+
   // Asynchronous variant of PyCall.
   // Returns a function to cancel the call. Calling this function after the call
   // has finished is legal and results in a no-op.
   absl::StatusOr<PyClientCallCanceller> AsyncPyCall(
-      const std::string& method, const pybind11::list& args,
+      const std::string& method, const pybind11::tuple& args,
       const pybind11::dict& kwargs, PyObjectCallback result_cb,
       PyObjectCallback exception_cb, bool wait_for_ready,
       absl::Time deadline, bool compress, bool chunk_tensors);
+
+  // Variant of AsyncPyCall which takes a timeout in seconds instead of a
+  // deadline. A zero timeout means no deadline is applied.
+  absl::StatusOr<PyClientCallCanceller> AsyncPyCall(
+      const std::string& method, const pybind11::tuple& args,
+      const pybind11::dict& kwargs, PyObjectCallback result_cb,
+      PyObjectCallback exception_cb, bool wait_for_ready,
+      double timeout_sec, bool compress, bool chunk_tensors);
+
+  // Issues a call without waiting for it to finish. The result and any error
+  // of the call are dropped, and its completion does not acquire the GIL.
+  // Only argument serialization errors are returned.
+  absl::Status OnewayPyCall(const std::string& method,
+                            const pybind11::tuple& args,
+                            const pybind11::dict& kwargs, bool wait_for_ready,
+                            double timeout_sec, bool compress,
+                            bool chunk_tensors);
+
+  // Returns the number of calls issued by `OnewayPyCall` which have not
+  // completed yet.
+  int64_t OnewayCallsInFlight() ABSL_LOCKS_EXCLUDED(oneway_mu_);
+
+  // Issues a batch of calls concurrently, releasing the GIL only once, and
+  // returns the list of their results in order. Returns the first error if any
+  // of the calls fails.
+  absl::StatusOr<pybind11::list> MultiPyCall(
+      const std::vector<PyCallSpec>& calls, bool wait_for_ready,
+      double timeout_sec, bool compress, bool chunk_tensors);
+
+  // Asynchronous variant of MultiPyCall. The callbacks are shared by all calls
+  // of the batch and receive the index of the call they complete. Returns one
+  // canceller per call.
+  absl::StatusOr<std::vector<PyClientCallCanceller>> AsyncMultiPyCall(
+      const std::vector<PyCallSpec>& calls, IndexedPyObjectCallback result_cb,
+      IndexedPyObjectCallback exception_cb, bool wait_for_ready,
+      double timeout_sec, bool compress, bool chunk_tensors);
+
+  // Serializes `args` and drops the result. Does not initialize the channel,
+  // so no connection to the server is attempted.
+  absl::Status WarmUp(const pybind11::tuple& args);
+
+ private:
+  absl::Mutex oneway_mu_;
+  // Contexts of the oneway calls in flight. Each context is kept alive by the
+  // completion callback of its call, which removes it from the set.
+  absl::flat_hash_set<CallContext*> oneway_calls_ ABSL_GUARDED_BY(oneway_mu_);
+};
+
+// Callable bound to a method of the server and to a fixed call configuration.
+// Calling it from Python dispatches straight into PyClient::PyCall, without a
+// Python-level trampoline.
+class PyClientMethod {
+ public:
+  PyClientMethod(std::shared_ptr<PyClient> client, std::string method,
+                 bool wait_for_ready, double timeout_sec, bool compress,
+                 bool chunk_tensors)
+      : client_(std::move(client)),
+        method_(std::move(method)),
+        wait_for_ready_(wait_for_ready),
+        timeout_sec_(timeout_sec),
+        compress_(compress),
+        chunk_tensors_(chunk_tensors) {}
+
+  absl::StatusOr<pybind11::object> Call(const pybind11::args& args,
+                                        const pybind11::kwargs& kwargs) {
+    return client_->PyCall(method_, args, kwargs, wait_for_ready_,
+                           timeout_sec_, compress_, chunk_tensors_);
+  }
+
+  const std::string& method() const { return method_; }
+
+ private:
+  const std::shared_ptr<PyClient> client_;
+  const std::string method_;
+  const bool wait_for_ready_;
+  const double timeout_sec_;
+  const bool compress_;
+  const bool chunk_tensors_;
 };
 
 }  // namespace courier
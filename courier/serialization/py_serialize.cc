@@ -186,11 +186,38 @@ bool PyClassModuleStartsWith(PyObject* object, const std::string& cmp) {
   return absl::StartsWith(class_module, cmp);
 }
 
+// Fast path for C-contiguous arrays in native byte order with a memcpy-able
+// type. The array buffer is copied straight into `tensor_content`, skipping
+// the intermediate tensorflow::Tensor. Returns false if `array` does not
+// qualify, in which case `proto` is left untouched.
+bool SerializeContiguousArray(PyArrayObject* array,
+                              tensorflow::TensorProto* proto) {
+  if (!PyArray_IS_C_CONTIGUOUS(array) || !PyArray_ISNOTSWAPPED(array)) {
+    return false;
+  }
+  tensorflow::DataType dtype;
+  absl::Status status =
+      ::deepmind::reverb::pybind::GetTensorDtypeFromPyArray(array, &dtype);
+  if (!status.ok() || !tensorflow::DataTypeCanUseMemcpy(dtype)) {
+    return false;
+  }
+  proto->set_dtype(dtype);
+  tensorflow::TensorShapeProto* shape = proto->mutable_tensor_shape();
+  for (int i = 0; i < PyArray_NDIM(array); ++i) {
+    shape->add_dim()->set_size(PyArray_DIM(array, i));
+  }
+  proto->set_tensor_content(static_cast<const char*>(PyArray_DATA(array)),
+                            PyArray_NBYTES(array));
+  return true;
+}
+
 absl::Status SerializeAsTensorProto(PyObject* object,
                                     tensorflow::TensorProto* proto) {
   PyArrayObject* array = reinterpret_cast<PyArrayObject*>(object);
   tensorflow::DataType dtype;
-  {
+  if (PyArray_Check(object) && SerializeContiguousArray(array, proto)) {
+    dtype = proto->dtype();
+  } else {
     tensorflow::Tensor tensor;
     tensorflow::Status status = ::deepmind::reverb::pybind::NdArrayToTensor(object, &tensor);
     if (absl::StartsWith(status.message(), "Unsupported object type")) {
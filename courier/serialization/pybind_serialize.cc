@@ -23,10 +23,12 @@ namespace courier {
 
 namespace py = pybind11;
 
-absl::Status SerializePybindArgs(const py::list& args, const py::dict& kwargs,
+absl::Status SerializePybindArgs(const py::tuple& args, const py::dict& kwargs,
                                  CallArguments* serialized) {
-  for (py::handle arg : args) {
-    PyObject* object = arg.ptr();
+  const Py_ssize_t num_args = PyTuple_GET_SIZE(args.ptr());
+  serialized->mutable_args()->Reserve(num_args);
+  for (Py_ssize_t i = 0; i < num_args; ++i) {
+    PyObject* object = PyTuple_GET_ITEM(args.ptr(), i);
     COURIER_RETURN_IF_ERROR(SerializePyObject(object, serialized->add_args()));
   }
 
@@ -25,7 +25,7 @@ namespace courier {
 
 // Serializes the arguments and keyword arguments passed to a Python function to
 // a CallArguments proto.
-absl::Status SerializePybindArgs(const pybind11::list& args,
+absl::Status SerializePybindArgs(const pybind11::tuple& args,
                                  const pybind11::dict& kwargs,
                                  CallArguments* serialized);
 
@@ -37,6 +37,9 @@ absl::Status NdArrayToTensor(PyObject *ndarray, tensorflow::Tensor *out_tensor);
 absl::Status GetPyDescrFromDataType(tensorflow::DataType dtype,
                                     PyArray_Descr **out_descr);
 
+absl::Status GetTensorDtypeFromPyArray(PyArrayObject *array,
+                                       tensorflow::DataType *out_tf_datatype);
+
 }  // namespace pybind
 }  // namespace reverb
 }  // namespace deepmind